@@ -4,6 +4,7 @@ from typing import List
 from models.post import Post
 from schemas.post import PostOut
 from core.database import get_db
+from core.config import settings
 from datetime import datetime, timezone
 from pydantic import validator   # <── added
 import shutil
@@ -12,9 +13,7 @@ import uuid
 
 router = APIRouter(prefix="/posts", tags=["posts"])
 
-POSTS_DIR = "static/posts"
-if not os.path.exists(POSTS_DIR):
-    os.makedirs(POSTS_DIR)
+POSTS_DIR = settings.POSTS_DIR
 
 
 # ----------  POST  ----------
@@ -41,6 +40,9 @@ async def create_scheduled_post(
         unique_filename = f"{uuid.uuid4()}{file_ext}"
         image_path = os.path.join(POSTS_DIR, unique_filename)
 
+        # Created by the migration step; this only guards fresh volumes
+        os.makedirs(POSTS_DIR, exist_ok=True)
+
         # Save the image file
         with open(image_path, "wb") as buffer:
             shutil.copyfileobj(image_file.file, buffer)
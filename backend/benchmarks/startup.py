@@ -0,0 +1,80 @@
+# backend/benchmarks/startup.py
+# Tracks API cold-start cost: how long `import main` takes, and how long a
+# fresh uvicorn process takes until /health answers.
+#
+# Run from the backend directory:  python benchmarks/startup.py [--runs N]
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure_import() -> float:
+    """Seconds for a fresh interpreter to import the API module."""
+    code = (
+        "import time; t = time.perf_counter(); import main; "
+        "print(time.perf_counter() - t)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def measure_readiness(timeout: float = 30.0) -> float:
+    """Seconds from launching uvicorn until GET /health returns 200."""
+    port = free_port()
+    url = f"http://127.0.0.1:{port}/health"
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port)],
+        cwd=BACKEND_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            if proc.poll() is not None:
+                raise RuntimeError("uvicorn exited before becoming ready")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as resp:
+                    if resp.status == 200:
+                        return time.perf_counter() - start
+            except OSError:
+                time.sleep(0.01)
+        raise TimeoutError(f"/health not ready after {timeout}s")
+    finally:
+        proc.terminate()
+        proc.wait()
+
+
+def report(name: str, samples: list) -> None:
+    print(
+        f"{name:<10} median {statistics.median(samples) * 1000:8.1f} ms   "
+        f"min {min(samples) * 1000:8.1f} ms   max {max(samples) * 1000:8.1f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API cold-start benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    report("import", [measure_import() for _ in range(args.runs)])
+    report("readiness", [measure_readiness() for _ in range(args.runs)])
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,9 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     DATABASE_URL: str = "sqlite:///./posts.db"
     POSTS_DIR: str = "static/posts"
+    # Process role: "api" serves HTTP requests, "scheduler" runs the
+    # publishing scheduler. API workers never start the scheduler.
+    APP_ROLE: str = "api"
 
     class Config:
         env_file = ".env"
@@ -13,11 +13,17 @@ Base = declarative_base()
 def init_db():
     """
     Initializes the database by creating all defined tables.
-    Also ensures the parent directory for the SQLite file exists.
+    Also ensures the parent directory for the SQLite file and the
+    uploaded-images directory exist.
+
+    This is the explicit migration step; the API no longer runs it on
+    startup. Run it once per deploy with `python -m core.migrate`.
     """
     import os
-    import sys
     from pathlib import Path
+
+    # Import the models so their tables are registered on Base.metadata
+    from models import post, design  # noqa: F401
     
     db_path = settings.DATABASE_URL.replace("sqlite:///", "")
 
@@ -28,6 +34,8 @@ def init_db():
         print(f"Created database directory: {db_dir}")
 
     
+    os.makedirs(settings.POSTS_DIR, exist_ok=True)
+
     Base.metadata.create_all(bind=engine)
     print("Database tables created successfully.")
 
@@ -0,0 +1,8 @@
+# backend/core/migrate.py
+# Explicit schema migration step, run once per deploy before the API and
+# scheduler roles start:  python -m core.migrate
+
+from core.database import init_db
+
+if __name__ == "__main__":
+    init_db()
@@ -82,14 +82,11 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from core.database import Base, engine
-from api.endpoints import post
-from services.scheduler import start_scheduler, stop_scheduler
-import uvicorn
-from datetime import datetime, timezone
 from api.endpoints import post, design, analytics
-from models import post as post_model
-from models import design as design_model
+
+# Startup is kept lean for fast cold starts:
+# - schema creation is an explicit step:  python -m core.migrate
+# - the scheduler runs as its own role:   APP_ROLE=scheduler python -m services.scheduler_runner
 
 
 
@@ -112,14 +109,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-@app.on_event("startup")
-def on_startup():
-    Base.metadata.create_all(bind=engine)
-    start_scheduler()
-
-@app.on_event("shutdown")
-def on_shutdown():
-    stop_scheduler()
+@app.get("/health", tags=["health"])
+def health():
+    """Readiness probe: answers as soon as the app can serve requests."""
+    return {"status": "ok"}
 
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
@@ -129,4 +122,5 @@ app.include_router(design.router)
 
 
 if __name__ == "__main__":
+    import uvicorn
     uvicorn.run("main:app", host="0.0.0.0", port=8001, reload=True)
\ No newline at end of file
@@ -2,8 +2,10 @@
 
 import logging
 from typing import Dict, List
-from google import genai
-from google.genai.errors import APIError
+
+# NOTE: the google-genai SDK is imported lazily inside the functions below.
+# It is heavy to import, and loading it only on first AI use keeps API
+# worker cold starts fast.
 
 # Configuration
 MODEL_NAME = "gemini-2.5-flash"
@@ -13,6 +15,7 @@ def get_gemini_client(api_key: str):
     if not api_key:
         return None
     try:
+        from google import genai
         client = genai.Client(api_key=api_key)   #  ←  FIXED
         client.models.get(model=MODEL_NAME)       #  quick validation
         return client
@@ -25,6 +28,7 @@ def call_gemini_or_mock(api_key: str, prompt: str, fallback_logic: callable, **k
     client = get_gemini_client(api_key)
 
     if client:
+        from google.genai.errors import APIError
         try:
             # Actual Gemini API call
             response = client.models.generate_content(
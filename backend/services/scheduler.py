@@ -4,6 +4,7 @@ from apscheduler.triggers.interval import IntervalTrigger
 from sqlalchemy.orm import Session
 from models.post import Post
 from core.database import SessionLocal, get_db
+from core.config import settings
 from datetime import datetime, timezone
 import random # Phase 5: Required for mock failure
 
@@ -78,6 +79,11 @@ def publish_pending_posts():
 
 
 def start_scheduler():
+    # Only the dedicated scheduler role may run jobs; API workers never do.
+    if settings.APP_ROLE != "scheduler":
+        logging.warning(f"Scheduler not started: APP_ROLE is '{settings.APP_ROLE}', expected 'scheduler'.")
+        return
+
     if not scheduler.running:
         # Check for missed posts on startup
         # We run this once before starting the interval trigger
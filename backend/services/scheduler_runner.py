@@ -1,22 +1,30 @@
 # backend/services/scheduler_runner.py
+# Entry point for the scheduler role, launched separately from the API:
+#   APP_ROLE=scheduler python -m services.scheduler_runner
+import sys
 import time
 import logging
-from apscheduler.schedulers.background import BackgroundScheduler
-from services.scheduler import start_scheduler, publish_pending_posts 
+from services.scheduler import scheduler, start_scheduler, stop_scheduler
 
 logging.basicConfig(level=logging.INFO)
 
-# Use the scheduler defined in services/scheduler.py or re-define if necessary
-# We'll use the one from the module for consistency.
 
-# Ensure the jobs are set up and running
-start_scheduler() 
+def main():
+    # Ensure the jobs are set up and running
+    start_scheduler()
+    if not scheduler.running:
+        logging.error("Scheduler Runner requires APP_ROLE=scheduler. Exiting.")
+        sys.exit(1)
 
-try:
-    # Keep the script alive forever
-    logging.info("Scheduler Runner started successfully. Monitoring posts...")
-    while True:
-        time.sleep(5)
-except (KeyboardInterrupt, SystemExit):
-    logging.info("Scheduler Runner shutting down.")
-    # The shutdown is automatically handled by the scheduler module
\ No newline at end of file
+    try:
+        # Keep the script alive forever
+        logging.info("Scheduler Runner started successfully. Monitoring posts...")
+        while True:
+            time.sleep(5)
+    except (KeyboardInterrupt, SystemExit):
+        logging.info("Scheduler Runner shutting down.")
+        stop_scheduler()
+
+
+if __name__ == "__main__":
+    main()